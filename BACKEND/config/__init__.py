@@ -1 +1 @@
-"""Config Module"""
+"""Config Module"""
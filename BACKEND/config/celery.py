@@ -1,9 +1,13 @@
-"""Celery Configuration"""
-import os
-from celery import Celery
-
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
-
-app = Celery('domicare')
-app.config_from_object('django.conf:settings', namespace='CELERY')
-app.autodiscover_tasks()
+"""Celery Configuration"""
+import os
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+
+app = Celery('domicare')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
+# 'services' is not an installed app and workers never import the service
+# modules, so name the task module explicitly - the default related_name
+# ('tasks') silently finds nothing and leaves the shared_tasks unregistered
+app.autodiscover_tasks(packages=['services'], related_name='email_tasks')
@@ -1,15 +1,15 @@
-﻿import cloudinary
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-def configure_cloudinary():
-    cloudinary.config(
-        cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-        api_key=os.getenv("CLOUDINARY_API_KEY"),
-        api_secret=os.getenv("CLOUDINARY_API_SECRET"),
-        secure=True
-    )
-
+﻿import cloudinary
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+def configure_cloudinary():
+    cloudinary.config(
+        cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+        api_key=os.getenv("CLOUDINARY_API_KEY"),
+        api_secret=os.getenv("CLOUDINARY_API_SECRET"),
+        secure=True
+    )
+
 configure_cloudinary()
\ No newline at end of file
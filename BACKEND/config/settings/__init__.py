@@ -1 +1 @@
-"""Settings Module"""
+"""Settings Module"""
@@ -1,24 +1,24 @@
-"""Development Settings"""
-from .base import *
-
-DEBUG = True
-
-ALLOWED_HOSTS = ['*']
-
-# Development-specific settings
-EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
-
-# Logging
-LOGGING = {
-    'version': 1,
-    'disable_existing_loggers': False,
-    'handlers': {
-        'console': {
-            'class': 'logging.StreamHandler',
-        },
-    },
-    'root': {
-        'handlers': ['console'],
-        'level': 'DEBUG',
-    },
-}
+"""Development Settings"""
+from .base import *
+
+DEBUG = True
+
+ALLOWED_HOSTS = ['*']
+
+# Development-specific settings
+EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+
+# Logging
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': 'DEBUG',
+    },
+}
@@ -1,20 +1,20 @@
-"""Test Settings"""
-from .base import *
-
-DEBUG = True
-
-# Use in-memory SQLite for faster tests
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': ':memory:',
-    }
-}
-
-# Disable password hashing for faster tests
-PASSWORD_HASHERS = [
-    'django.contrib.auth.hashers.MD5PasswordHasher',
-]
-
-# Email
-EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+"""Test Settings"""
+from .base import *
+
+DEBUG = True
+
+# Use in-memory SQLite for faster tests
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Disable password hashing for faster tests
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Email
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
@@ -1 +1 @@
-"""Controllers Package"""
+"""Controllers Package"""
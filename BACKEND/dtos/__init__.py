@@ -1 +1 @@
-"""DTOs Package"""
+"""DTOs Package"""
@@ -1 +1 @@
-"""Auth DTOs Package"""
+"""Auth DTOs Package"""
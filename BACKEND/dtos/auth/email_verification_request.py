@@ -1,2 +1,2 @@
-﻿class EmailVerificationRequest:
+﻿class EmailVerificationRequest:
     token: str
\ No newline at end of file
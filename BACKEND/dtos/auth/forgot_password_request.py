@@ -1,5 +1,5 @@
-﻿from pydantic import EmailStr
-
-
-class ForgotPasswordRequest:
+﻿from pydantic import EmailStr
+
+
+class ForgotPasswordRequest:
     email: EmailStr
\ No newline at end of file
@@ -1,14 +1,14 @@
-from pydantic import BaseModel, Field, EmailStr
-
-class LoginRequest(BaseModel):
-    email: EmailStr = Field(..., description="Email must be a valid email address")
-    password: str = Field(..., min_length=8, description="Password is required")
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "email": "user@example.com",
-                "password": "password123"
-            }
-        }
+from pydantic import BaseModel, Field, EmailStr
+
+class LoginRequest(BaseModel):
+    email: EmailStr = Field(..., description="Email must be a valid email address")
+    password: str = Field(..., min_length=8, description="Password is required")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "email": "user@example.com",
+                "password": "password123"
+            }
+        }
     
\ No newline at end of file
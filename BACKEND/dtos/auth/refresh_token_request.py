@@ -1,5 +1,5 @@
-﻿from pydantic import BaseModel
-
-
-class RefreshTokenRequest(BaseModel):
+﻿from pydantic import BaseModel
+
+
+class RefreshTokenRequest(BaseModel):
     refresh_token: str
\ No newline at end of file
@@ -1,6 +1,6 @@
-﻿from pydantic import EmailStr, BaseModel
-
-
-class RefreshTokenResponse(BaseModel):
-    access_token: str
+﻿from pydantic import EmailStr, BaseModel
+
+
+class RefreshTokenResponse(BaseModel):
+    access_token: str
     email: EmailStr
\ No newline at end of file
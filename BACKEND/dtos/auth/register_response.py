@@ -1,7 +1,7 @@
-﻿from pydantic import EmailStr, BaseModel
-
-
-class RegisterResponse(BaseModel):
-    id: int
-    email: EmailStr
+﻿from pydantic import EmailStr, BaseModel
+
+
+class RegisterResponse(BaseModel):
+    id: int
+    email: EmailStr
     message: str = "Registration successful. Please check your email to confirm your account."
\ No newline at end of file
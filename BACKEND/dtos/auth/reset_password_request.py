@@ -1,6 +1,6 @@
-﻿from pydantic import EmailStr
-
-
-class ResetPasswordRequest:
-    email: EmailStr
+﻿from pydantic import EmailStr
+
+
+class ResetPasswordRequest:
+    email: EmailStr
     password: str
\ No newline at end of file
@@ -1,12 +1,12 @@
-﻿from typing import Optional
-
-from pydantic import BaseModel
-
-
-class RoleDTO(BaseModel):
-    id: Optional[int] = None
-    name: str
-    description: Optional[str] = None
-
-    class Config:
+﻿from typing import Optional
+
+from pydantic import BaseModel
+
+
+class RoleDTO(BaseModel):
+    id: Optional[int] = None
+    name: str
+    description: Optional[str] = None
+
+    class Config:
         from_attributes = True  # For ORM compatibility
\ No newline at end of file
@@ -1 +1 @@
-"""Exceptions Package"""
+"""Exceptions Package"""
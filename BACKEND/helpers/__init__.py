@@ -1 +1 @@
-"""Helpers Package"""
+"""Helpers Package"""
@@ -1 +1 @@
-"""Mappers Package"""
+"""Mappers Package"""
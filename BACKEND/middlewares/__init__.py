@@ -1 +1 @@
-"""Middlewares Package"""
+"""Middlewares Package"""
@@ -1,5 +1,5 @@
-from django.apps import AppConfig
-
-class ModelsConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'models'
+from django.apps import AppConfig
+
+class ModelsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'models'
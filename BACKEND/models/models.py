@@ -1,33 +1,33 @@
-"""
-Django models - Import all models here for Django to discover them
-"""
-from .user import User, UserRole
-from .booking import Booking, BookingProduct
-from .product import Product
-from .category import Category
-from .review import Review
-from .role import Role, PermissionRole
-from .permission import Permission
-from .file import File
-from .token import Token
-from .payment import PaymentTransaction
-from .enums import BookingStatus, Gender, PaymentStatus
-
-__all__ = [
-    'User',
-    'UserRole',
-    'Booking',
-    'BookingProduct',
-    'Product',
-    'Category',
-    'Review',
-    'Role',
-    'PermissionRole',
-    'Permission',
-    'File',
-    'Token',
-    'PaymentTransaction',
-    'BookingStatus',
-    'Gender',
-    'PaymentStatus',
+"""
+Django models - Import all models here for Django to discover them
+"""
+from .user import User, UserRole
+from .booking import Booking, BookingProduct
+from .product import Product
+from .category import Category
+from .review import Review
+from .role import Role, PermissionRole
+from .permission import Permission
+from .file import File
+from .token import Token
+from .payment import PaymentTransaction
+from .enums import BookingStatus, Gender, PaymentStatus
+
+__all__ = [
+    'User',
+    'UserRole',
+    'Booking',
+    'BookingProduct',
+    'Product',
+    'Category',
+    'Review',
+    'Role',
+    'PermissionRole',
+    'Permission',
+    'File',
+    'Token',
+    'PaymentTransaction',
+    'BookingStatus',
+    'Gender',
+    'PaymentStatus',
 ]
\ No newline at end of file
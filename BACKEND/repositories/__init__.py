@@ -1 +1 @@
-"""Repositories Package"""
+"""Repositories Package"""
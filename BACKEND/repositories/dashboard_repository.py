@@ -0,0 +1,85 @@
+from datetime import datetime
+
+from django.db.models import Count, Q, Sum
+
+from models.booking import Booking
+from models.review import Review
+from models.user import User
+
+
+class DashboardRepository:
+    """Cross-period dashboard aggregates - one round trip per table"""
+
+    @staticmethod
+    def booking_summary(
+        current_start: datetime, current_end: datetime,
+        prev_start: datetime, prev_end: datetime,
+        success_status: str,
+    ) -> dict:
+        """Successful booking count and revenue for two periods in one query"""
+        current = Q(
+            booking_status=success_status,
+            create_at__gte=current_start,
+            create_at__lte=current_end,
+        )
+        previous = Q(
+            booking_status=success_status,
+            create_at__gte=prev_start,
+            create_at__lte=prev_end,
+        )
+        result = Booking.objects.aggregate(
+            current_bookings=Count('id', filter=current),
+            current_revenue=Sum('total_price', filter=current),
+            prev_bookings=Count('id', filter=previous),
+            prev_revenue=Sum('total_price', filter=previous),
+        )
+        # Sum over a DecimalField yields Decimal (or None); the summary has
+        # always exposed integral revenue and mixes these with float math
+        result['current_revenue'] = int(result['current_revenue'] or 0)
+        result['prev_revenue'] = int(result['prev_revenue'] or 0)
+        return result
+
+    @staticmethod
+    def user_summary(
+        role_name: str,
+        current_start: datetime, current_end: datetime,
+        prev_start: datetime, prev_end: datetime,
+    ) -> dict:
+        """New-user counts for two periods in one query"""
+        return User.objects.aggregate(
+            current_users=Count(
+                'id',
+                filter=Q(
+                    roles__name=role_name,
+                    create_at__gte=current_start,
+                    create_at__lte=current_end,
+                ),
+                distinct=True,
+            ),
+            prev_users=Count(
+                'id',
+                filter=Q(
+                    roles__name=role_name,
+                    create_at__gte=prev_start,
+                    create_at__lte=prev_end,
+                ),
+                distinct=True,
+            ),
+        )
+
+    @staticmethod
+    def review_summary(
+        current_start: datetime, current_end: datetime,
+        prev_start: datetime, prev_end: datetime,
+    ) -> dict:
+        """Review counts for two periods in one query"""
+        return Review.objects.aggregate(
+            current_reviews=Count(
+                'id',
+                filter=Q(create_at__gte=current_start, create_at__lte=current_end),
+            ),
+            prev_reviews=Count(
+                'id',
+                filter=Q(create_at__gte=prev_start, create_at__lte=prev_end),
+            ),
+        )
@@ -1,116 +1,171 @@
-﻿from datetime import datetime
-from typing import Optional, Tuple, List
-from models.user import User
-from utils.format_string import FormatStringAccents
-
-
-# find user by email
-def find_by_email(email: str) -> Optional[User]:
-    try:
-        return User.objects.select_related().prefetch_related('roles').get(email=email)
-    except User.DoesNotExist:
-        return None
-
-# exists by email
-def exists_by_email(email: str) -> bool:
-    return User.objects.filter(email=email).exists()
-
-# find by email confirmation token
-def find_by_email_confirmation_token(token: str) -> Optional[User]:
-    try:
-        return User.objects.get(email_confirmation_token=token, is_deleted=False)
-    except User.DoesNotExist:
-        return None
-
-# save user
-def save(user: User) -> User:
-    user.save()
-    return user
-
-# create user
-def create_user(email: str, password_hash: str, **kwargs) -> User:
-    user = User(
-        email=email,
-        password=password_hash,
-        **kwargs
-    )
-    user.save()
-    return user
-
-class UserRepository:
-    def find_by_email(self, email: str) -> Optional[User]:
-        return find_by_email(email)
-
-    def exists_by_email(self, email: str) -> bool:
-        return exists_by_email(email)
-
-    def find_by_email_confirmation_token(self, token: str) -> Optional[User]:
-        return find_by_email_confirmation_token(token)
-
-    def save(self, user: User) -> User:
-        return save(user)
-
-    def create_user(self, email: str, password_hash: str, **kwargs) -> User:
-        return create_user(email, password_hash, **kwargs)
-
-    @staticmethod
-    def find_all_paginated(
-        page: int = 1,
-        page_size: int = 20,
-        search_name: Optional[str] = None,
-        search_role_name: Optional[str] = None,
-        sort_by: str = 'create_at',
-        sort_direction: str = 'desc',
-    ) -> Tuple[List[User], int]:
-        """Find all users with pagination and filtering"""
-        queryset = User.objects.prefetch_related('roles').filter(is_deleted=False)
-
-        # Search by name
-        if search_name and search_name.strip():
-            clean_search_name = FormatStringAccents.remove_accents(search_name)
-            queryset = queryset.filter(name_unsigned__icontains=clean_search_name)
-
-        # Filter by role name
-        if search_role_name and search_role_name.strip():
-            queryset = queryset.filter(roles__name__icontains=search_role_name)
-
-        # Sorting
-        sort_field = sort_by if sort_direction == 'asc' else f'-{sort_by}'
-        queryset = queryset.order_by(sort_field)
-
-        # Get total count
-        total = queryset.count()
-
-        # Pagination
-        start = (page - 1) * page_size
-        end = start + page_size
-        users = list(queryset[start:end])
-
-        return users, total
-
-    @staticmethod
-    def soft_delete_by_id(user_id: int) -> None:
-        """Soft delete user by ID"""
-        User.objects.filter(id=user_id).update(is_deleted=True)
-
-    @staticmethod
-    def count_all_users_between(role_name: str, start_date: datetime, end_date: datetime) -> int:
-        """Count users with specific role created between two dates"""
-        return User.objects.filter(
-            roles__name=role_name,
-            create_at__gte=start_date,
-            create_at__lte=end_date,
-        ).count()
-
-    @staticmethod
-    def find_by_id(user_id: int) -> Optional[User]:
-        """Find user by ID"""
-        try:
-            return User.objects.prefetch_related('roles').get(id=user_id)
-        except User.DoesNotExist:
-            return None
-
-    @staticmethod
-    def exists_by_id(user_id: int) -> bool:
-        """Check if user exists by ID"""
-        return User.objects.filter(id=user_id).exists()
\ No newline at end of file
+﻿from datetime import datetime
+from typing import Optional, Tuple, List
+
+from django.core.cache import cache
+from django.db.models import F
+
+from models.user import User
+from utils.format_string import FormatStringAccents
+
+# Short TTL for the email lookup on hot paths; saves invalidate eagerly
+_USER_EMAIL_CACHE_TIMEOUT = 60
+
+
+def _email_cache_key(email: str) -> str:
+    return f"user:email:{email}"
+
+
+# find user by email
+def find_by_email(email: str) -> Optional[User]:
+    try:
+        return User.objects.select_related().prefetch_related('roles').get(email=email)
+    except User.DoesNotExist:
+        return None
+
+# find user by email, served from cache for up to a minute
+def find_by_email_cached(email: str) -> Optional[User]:
+    key = _email_cache_key(email)
+    user = cache.get(key)
+    if user is None:
+        user = find_by_email(email)
+        if user is not None:
+            cache.set(key, user, _USER_EMAIL_CACHE_TIMEOUT)
+    return user
+
+# exists by email
+def exists_by_email(email: str) -> bool:
+    return User.objects.filter(email=email).exists()
+
+# find by email confirmation token
+def find_by_email_confirmation_token(token: str) -> Optional[User]:
+    try:
+        return User.objects.get(email_confirmation_token=token, is_deleted=False)
+    except User.DoesNotExist:
+        return None
+
+# save user
+def save(user: User, update_fields=None) -> User:
+    user.save(update_fields=update_fields)
+    cache.delete(_email_cache_key(user.email))
+    return user
+
+# set the email confirmation token without loading the row
+def set_verification_token(email: str, token: str) -> bool:
+    updated = User.objects.filter(email=email).update(email_confirmation_token=token)
+    if updated:
+        cache.delete(_email_cache_key(email))
+    return bool(updated)
+
+# create user
+def create_user(email: str, password_hash: str, **kwargs) -> User:
+    user = User(
+        email=email,
+        password=password_hash,
+        **kwargs
+    )
+    user.save()
+    return user
+
+class UserRepository:
+    def find_by_email(self, email: str) -> Optional[User]:
+        return find_by_email(email)
+
+    def find_by_email_cached(self, email: str) -> Optional[User]:
+        return find_by_email_cached(email)
+
+    def exists_by_email(self, email: str) -> bool:
+        return exists_by_email(email)
+
+    def find_by_email_confirmation_token(self, token: str) -> Optional[User]:
+        return find_by_email_confirmation_token(token)
+
+    def save(self, user: User, update_fields=None) -> User:
+        return save(user, update_fields=update_fields)
+
+    def set_verification_token(self, email: str, token: str) -> bool:
+        return set_verification_token(email, token)
+
+    def create_user(self, email: str, password_hash: str, **kwargs) -> User:
+        return create_user(email, password_hash, **kwargs)
+
+    @staticmethod
+    def find_all_paginated(
+        page: int = 1,
+        page_size: int = 20,
+        search_name: Optional[str] = None,
+        search_role_name: Optional[str] = None,
+        sort_by: str = 'create_at',
+        sort_direction: str = 'desc',
+    ) -> Tuple[List[User], int]:
+        """Find all users with pagination and filtering"""
+        queryset = User.objects.prefetch_related('roles').filter(is_deleted=False)
+
+        # Search by name
+        if search_name and search_name.strip():
+            clean_search_name = FormatStringAccents.remove_accents(search_name)
+            queryset = queryset.filter(name_unsigned__icontains=clean_search_name)
+
+        # Filter by role name
+        if search_role_name and search_role_name.strip():
+            queryset = queryset.filter(roles__name__icontains=search_role_name)
+
+        # Sorting
+        sort_field = sort_by if sort_direction == 'asc' else f'-{sort_by}'
+        queryset = queryset.order_by(sort_field)
+
+        # Get total count
+        total = queryset.count()
+
+        # Pagination
+        start = (page - 1) * page_size
+        end = start + page_size
+        users = list(queryset[start:end])
+
+        return users, total
+
+    @staticmethod
+    def soft_delete_by_id(user_id: int) -> None:
+        """Soft delete user by ID"""
+        User.objects.filter(id=user_id).update(is_deleted=True)
+
+    @staticmethod
+    def count_all_users_between(role_name: str, start_date: datetime, end_date: datetime) -> int:
+        """Count users with specific role created between two dates"""
+        return User.objects.filter(
+            roles__name=role_name,
+            create_at__gte=start_date,
+            create_at__lte=end_date,
+        ).count()
+
+    @staticmethod
+    def find_by_id(user_id: int) -> Optional[User]:
+        """Find user by ID"""
+        try:
+            return User.objects.prefetch_related('roles').get(id=user_id)
+        except User.DoesNotExist:
+            return None
+
+    @staticmethod
+    def exists_by_id(user_id: int) -> bool:
+        """Check if user exists by ID"""
+        return User.objects.filter(id=user_id).exists()
+
+    @staticmethod
+    def increment_booking_counters(user_id: int, sale_total: int = 0, success: int = 0, failed: int = 0) -> None:
+        """Apply atomic F() increments to the denormalized booking counters"""
+        updates = {}
+        if sale_total:
+            updates['sale_total_bookings'] = F('sale_total_bookings') + sale_total
+        if success:
+            updates['user_total_success_bookings'] = F('user_total_success_bookings') + success
+        if failed:
+            updates['user_total_failed_bookings'] = F('user_total_failed_bookings') + failed
+        if updates:
+            User.objects.filter(id=user_id).update(**updates)
+
+    @staticmethod
+    def refresh_sale_success_percent(user_id: int) -> None:
+        """Recompute the success percentage from the stored counters in SQL"""
+        User.objects.filter(id=user_id, sale_total_bookings__gt=0).update(
+            sale_success_percent=100.0 * F('user_total_success_bookings') / F('sale_total_bookings')
+        )
\ No newline at end of file
@@ -1 +1 @@
-"""Routes Package"""
+"""Routes Package"""
@@ -1 +1 @@
-"""Seed Package"""
+"""Seed Package"""
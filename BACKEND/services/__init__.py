@@ -1 +1 @@
-"""Services Package"""
+"""Services Package"""
@@ -1,140 +1,181 @@
-﻿import uuid
-
-from django.conf import settings
-import logging
-
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-
-from exceptions.user_exceptions import UserNotFoundException
-from repositories.user_repository import UserRepository
-
-logger = logging.getLogger(__name__)
-class EmailService:
-    def __init__(self):
-        self.user_repo = UserRepository()
-        self.frontend_url = settings.FRONTEND_URL
-        self.backend_url = settings.BACKEND_URL
-        self.logo_url = settings.LOGO_URL
-
-    def create_verification_token(self, email: str) -> str:
-        user = self.user_repo.find_by_email(email)
-        if not user:
-            raise UserNotFoundException(f"User with email {email} not found")
-
-        token = str(uuid.uuid4())
-        user.email_confirmation_token = token
-        self.user_repo.save(user)
-
-        logger.info(f"[EmailService] Created email verification token for {email}")
-        return token
-
-    def send_verification_email(self, email: str):
-        token = self.create_verification_token(email)
-
-        context = {
-            'verification_token': token,
-            'frontend_url': self.frontend_url,
-            'backend_url': self.backend_url,
-            'logo_url': self.logo_url,
-            'verify_url': f"{self.backend_url}/verify-email?token={token}"
-        }
-
-        html_message = render_to_string('emails/verification.html', context)
-
-        send_mail(
-            subject='[DOMICARE] - Xác nhận email của bạn',
-            message='',
-            from_email=settings.EMAIL_HOST_USER,
-            recipient_list=[email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-
-        logger.info(f"[EmailService] Email sent to {email}")
-
-    def send_reset_password_email(self, email: str):
-        token = self.create_verification_token(email)
-        print(f"Reset token: {token}")
-
-        context = {
-            'email': email,
-            'verification_token': token,
-            'frontend_url': self.frontend_url,
-            'backend_url': self.backend_url,
-            'logo_url': self.logo_url,
-            'reset_url': f"{self.backend_url}/api/v1/auth/forgot-password?token={token}"
-        }
-
-        html_message = render_to_string('emails/reset_password.html', context)
-
-        send_mail(
-            subject='[DOMICARE] - Đặt lại mật khẩu của bạn',
-            message='',
-            from_email=settings.EMAIL_HOST_USER,
-            recipient_list=[email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-
-        logger.info(f"[EmailService] Reset password email sent to {email}")
-
-    def send_password_to_user(self, email: str, name: str, password: str):
-        """Send random password to guest user"""
-        subject = '[DOMICARE] - MẬT KHẨU TÀI KHOẢN CỦA BẠN'
-        context = {
-            'name': name,
-            'email': email,
-            'password': password,
-            'frontend_url': self.frontend_url,
-            'logo_url': self.logo_url
-        }
-        html_message = render_to_string('emails/guest_password.html', context)
-        send_mail(
-            subject=subject,
-            message='',
-            from_email=settings.EMAIL_HOST_USER,
-            recipient_list=[email],
-            html_message=html_message,
-            fail_silently=False
-        )
-
-    def send_accepted_to_user(self, email: str, product_name: str, booking_date: str, customer_name: str):
-        """Send email when booking is accepted"""
-        subject = '[DOMICARE] - ĐƠN HÀNG ĐÃ ĐƯỢC CHẤP NHẬN'
-        context = {
-            'customer_name': customer_name,
-            'product_name': product_name,
-            'booking_date': booking_date,
-            'frontend_url': self.frontend_url,
-            'logo_url': self.logo_url
-        }
-        html_message = render_to_string('emails/booking_accepted.html', context)
-        send_mail(
-            subject=subject,
-            message='',
-            from_email=settings.EMAIL_HOST_USER,
-            recipient_list=[email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-
-    def send_reject_to_user(self, email: str, product_name: str, booking_date: str, customer_name: str):
-        """Send email when booking is rejected"""
-        subject = '[DOMICARE] - ĐƠN HÀNG ĐÃ BỊ TỪ CHỐI'
-        context = {
-            'customer_name': customer_name,
-            'product_name': product_name,
-            'booking_date': booking_date,
-            'frontend_url': self.frontend_url,
-            'logo_url': self.logo_url
-        }
-        html_message = render_to_string('emails/booking_rejected.html', context)
-        send_mail(
-            subject=subject,
-            message='',
-            from_email=settings.EMAIL_HOST_USER,
-            recipient_list=[email],
-            html_message=html_message,
-            fail_silently=False,
-        )
\ No newline at end of file
+﻿import uuid
+
+from django.conf import settings
+import logging
+
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
+from django.template.loader import get_template
+
+from exceptions.user_exceptions import UserNotFoundException
+from repositories.user_repository import UserRepository
+
+logger = logging.getLogger(__name__)
+class EmailService:
+    def __init__(self):
+        self.user_repo = UserRepository()
+        self.frontend_url = settings.FRONTEND_URL
+        self.backend_url = settings.BACKEND_URL
+        self.logo_url = settings.LOGO_URL
+
+        # Resolve and parse each template once; render_to_string goes back
+        # through the loaders (and re-reads the file - APP_DIRS templates are
+        # not behind the cached loader) on every single email
+        self._verification_tmpl = get_template('emails/verification.html')
+        self._reset_password_tmpl = get_template('emails/reset_password.html')
+        self._guest_password_tmpl = get_template('emails/guest_password.html')
+        self._accepted_tmpl = get_template('emails/booking_accepted.html')
+        self._rejected_tmpl = get_template('emails/booking_rejected.html')
+
+    def create_verification_token(self, email: str) -> str:
+        # One UPDATE instead of SELECT-then-save; zero rows means no such user
+        token = str(uuid.uuid4())
+        if not self.user_repo.set_verification_token(email, token):
+            raise UserNotFoundException(f"User with email {email} not found")
+
+        logger.info(f"[EmailService] Created email verification token for {email}")
+        return token
+
+    def send_verification_email(self, email: str):
+        """Create the token synchronously, hand the SMTP work to a worker"""
+        from services.email_tasks import send_verification_email_task
+
+        token = self.create_verification_token(email)
+        send_verification_email_task.delay(email, token)
+
+    def deliver_verification_email(self, email: str, token: str):
+        """Render and send the verification email (runs on a worker)"""
+        context = {
+            'verification_token': token,
+            'frontend_url': self.frontend_url,
+            'backend_url': self.backend_url,
+            'logo_url': self.logo_url,
+            'verify_url': f"{self.backend_url}/verify-email?token={token}"
+        }
+
+        html_message = self._verification_tmpl.render(context)
+
+        send_mail(
+            subject='[DOMICARE] - Xác nhận email của bạn',
+            message='',
+            from_email=settings.EMAIL_HOST_USER,
+            recipient_list=[email],
+            html_message=html_message,
+            fail_silently=False,
+        )
+
+        logger.info(f"[EmailService] Email sent to {email}")
+
+    def send_reset_password_email(self, email: str):
+        """Create the token synchronously, hand the SMTP work to a worker"""
+        from services.email_tasks import send_reset_password_email_task
+
+        token = self.create_verification_token(email)
+        send_reset_password_email_task.delay(email, token)
+
+    def deliver_reset_password_email(self, email: str, token: str):
+        """Render and send the reset-password email (runs on a worker)"""
+        context = {
+            'email': email,
+            'verification_token': token,
+            'frontend_url': self.frontend_url,
+            'backend_url': self.backend_url,
+            'logo_url': self.logo_url,
+            'reset_url': f"{self.backend_url}/api/v1/auth/forgot-password?token={token}"
+        }
+
+        html_message = self._reset_password_tmpl.render(context)
+
+        send_mail(
+            subject='[DOMICARE] - Đặt lại mật khẩu của bạn',
+            message='',
+            from_email=settings.EMAIL_HOST_USER,
+            recipient_list=[email],
+            html_message=html_message,
+            fail_silently=False,
+        )
+
+        logger.info(f"[EmailService] Reset password email sent to {email}")
+
+    def send_password_to_user(self, email: str, name: str, password: str):
+        """Send random password to guest user"""
+        subject = '[DOMICARE] - MẬT KHẨU TÀI KHOẢN CỦA BẠN'
+        context = {
+            'name': name,
+            'email': email,
+            'password': password,
+            'frontend_url': self.frontend_url,
+            'logo_url': self.logo_url
+        }
+        html_message = self._guest_password_tmpl.render(context)
+        send_mail(
+            subject=subject,
+            message='',
+            from_email=settings.EMAIL_HOST_USER,
+            recipient_list=[email],
+            html_message=html_message,
+            fail_silently=False
+        )
+
+    def send_accepted_to_user(self, email: str, product_name: str, booking_date: str, customer_name: str):
+        """Send email when booking is accepted"""
+        subject = '[DOMICARE] - ĐƠN HÀNG ĐÃ ĐƯỢC CHẤP NHẬN'
+        context = {
+            'customer_name': customer_name,
+            'product_name': product_name,
+            'booking_date': booking_date,
+            'frontend_url': self.frontend_url,
+            'logo_url': self.logo_url
+        }
+        html_message = self._accepted_tmpl.render(context)
+        send_mail(
+            subject=subject,
+            message='',
+            from_email=settings.EMAIL_HOST_USER,
+            recipient_list=[email],
+            html_message=html_message,
+            fail_silently=False,
+        )
+
+    def send_reject_to_user(self, email: str, product_name: str, booking_date: str, customer_name: str):
+        """Send email when booking is rejected"""
+        subject = '[DOMICARE] - ĐƠN HÀNG ĐÃ BỊ TỪ CHỐI'
+        context = {
+            'customer_name': customer_name,
+            'product_name': product_name,
+            'booking_date': booking_date,
+            'frontend_url': self.frontend_url,
+            'logo_url': self.logo_url
+        }
+        html_message = self._rejected_tmpl.render(context)
+        send_mail(
+            subject=subject,
+            message='',
+            from_email=settings.EMAIL_HOST_USER,
+            recipient_list=[email],
+            html_message=html_message,
+            fail_silently=False,
+        )
+
+    def send_bulk(self, messages: list) -> int:
+        """Send many emails over one SMTP connection.
+
+        messages: iterables of (subject, html_message, recipient_list).
+        Returns the number of messages sent.
+        """
+        emails = []
+        for subject, html_message, recipient_list in messages:
+            email = EmailMultiAlternatives(
+                subject=subject,
+                body='',
+                from_email=settings.EMAIL_HOST_USER,
+                to=recipient_list,
+            )
+            email.attach_alternative(html_message, 'text/html')
+            emails.append(email)
+
+        if not emails:
+            return 0
+
+        # One connection for the whole batch instead of a TLS handshake per mail
+        connection = get_connection(fail_silently=False)
+        return connection.send_messages(emails)
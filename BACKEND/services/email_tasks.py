@@ -0,0 +1,51 @@
+"""Celery tasks for outgoing email - keeps SMTP latency off request threads"""
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def send_verification_email_task(self, email: str, token: str):
+    """Send the account-verification email from a worker"""
+    from services.email_service import EmailService
+    try:
+        EmailService().deliver_verification_email(email, token)
+    except Exception as exc:
+        logger.error("[EmailTasks] Failed to send verification email to %s: %s", email, exc)
+        raise self.retry(exc=exc)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def send_reset_password_email_task(self, email: str, token: str):
+    """Send the reset-password email from a worker"""
+    from services.email_service import EmailService
+    try:
+        EmailService().deliver_reset_password_email(email, token)
+    except Exception as exc:
+        logger.error("[EmailTasks] Failed to send reset-password email to %s: %s", email, exc)
+        raise self.retry(exc=exc)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def send_accepted_to_user_task(self, email: str, product_name: str, booking_date: str, customer_name: str):
+    """Send the booking-accepted email from a worker"""
+    # Imported lazily so the task module stays importable without Django apps loaded
+    from services.email_service import EmailService
+    try:
+        EmailService().send_accepted_to_user(email, product_name, booking_date, customer_name)
+    except Exception as exc:
+        logger.error("[EmailTasks] Failed to send accepted email to %s: %s", email, exc)
+        raise self.retry(exc=exc)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def send_reject_to_user_task(self, email: str, product_name: str, booking_date: str, customer_name: str):
+    """Send the booking-rejected email from a worker"""
+    from services.email_service import EmailService
+    try:
+        EmailService().send_reject_to_user(email, product_name, booking_date, customer_name)
+    except Exception as exc:
+        logger.error("[EmailTasks] Failed to send rejected email to %s: %s", email, exc)
+        raise self.retry(exc=exc)
@@ -1 +1 @@
-"""Utils Package"""
+"""Utils Package"""